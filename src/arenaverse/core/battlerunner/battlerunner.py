@@ -18,19 +18,26 @@ Quick examples
 
   # 1 000 Monte-Carlo duels with a fixed seed
   $ python battle_runner.py --mode monte -n 1000 --seed 123
+
+Interpreters
+------------
+The engine is std-lib only (no numpy / numba) and runs identically on
+CPython 3.10–3.13 (slotted dataclasses, `int.bit_count`).  Nothing in it
+is CPython-specific, so it should also run on PyPy 3.10+ (untested):
+
+  $ PYTHONPATH=src pypy3 -m arenaverse.core.battlerunner.battlerunner --mode monte -n 100000
 '''
 from __future__ import annotations
 
 # ── std-lib ────────────────────────────────────────────────────────────
 import argparse
-import random
-from copy import deepcopy
-from statistics import mean
+import secrets
 from typing import List, Tuple
 
 # ── engine imports ─────────────────────────────────────────────────────
 from ..combat.combatant import Combatant
 from ..combat.encounter import CombatEncounter, BattleLog
+from ..combat import mc_kernel
 # (formulas isn’t used directly here but is handy for future tweaks)
 from ..combat import formulas   # noqa: F401
 
@@ -63,24 +70,31 @@ CORE_KEYS = (
     "HP", "weapon_damage", "armor",
 )
 
+# "KEY:%s" per core stat and the block layout, built once at import.
+_CORE_FMT = tuple((k, k + ":%s") for k in CORE_KEYS)
+_SNAP_FMT = "%s\n  Stats : %s\n  Skills: %s\n"
+
 def snapshot(unit: Combatant) -> str:
     """Neat multi-line dump of a combatant’s build (no gear yet)."""
-    stats = unit.total_stats()
-    stats.setdefault("HP", unit.max_hp)          # ensure HP is shown
-    core  = ", ".join(f"{k}:{stats.get(k, 0)}" for k in CORE_KEYS if k in stats)
-    skills = ", ".join(s.name for s in getattr(unit, "hotbar", [])[:3]) or "BasicAttack"
-    return f"{unit.name}\n  Stats : {core}\n  Skills: {skills}\n"
+    stats = unit.total_stats()                   # cached – read only
+    hp    = stats.get("HP", unit.max_hp)         # ensure HP is shown
+    core  = ", ".join([fmt % (hp if k == "HP" else stats[k])
+                       for k, fmt in _CORE_FMT if k == "HP" or k in stats])
+    hotbar = unit.hotbar or ()                   # None until a battle fills it
+    skills = ", ".join([s.name for s in hotbar[:3]]) or "BasicAttack"
+    return _SNAP_FMT % (unit.name, core, skills)
 
 # ───────────────────────────────────────────────────────────────────────
 # Single detailed encounter
 # ───────────────────────────────────────────────────────────────────────
 def run_single(seed: int | None = None, quiet: bool = False) -> None:
     a0, b0 = make_default_fighters()
-    seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+    seed = seed if seed is not None else secrets.randbits(32)
     print(f"[INFO] Seed for this encounter: {seed}\n")
 
-    p1, p2 = deepcopy(a0), deepcopy(b0)
-    battle  = CombatEncounter([p1, p2], rng_seed=seed)
+    p1, p2 = a0.clone_for_battle(), b0.clone_for_battle()
+    # --quiet never prints the log, so don't build it
+    battle  = CombatEncounter([p1, p2], rng_seed=seed, collect_log=not quiet)
     log: BattleLog = battle.run_battle()
 
     # ── report ─────────────────────────────────────────────────────────
@@ -95,40 +109,68 @@ def run_single(seed: int | None = None, quiet: bool = False) -> None:
     winner = next((c for c in battle.combatants if c.is_alive), None)
     print("\n=== Result ===")
     if winner:
-        print(f"Winner: {winner.name} in {len(log.rounds)} rounds")
+        print(f"Winner: {winner.name} in {battle.rounds_fought} rounds")
     else:
-        print(f"Draw after {len(log.rounds)} rounds")
+        print(f"Draw after {battle.rounds_fought} rounds")
 
 # ───────────────────────────────────────────────────────────────────────
 # Monte-Carlo aggregate
 # ───────────────────────────────────────────────────────────────────────
+# winner_index() → outcome code; index -1 (no survivor) lands on DRAW.
+_OUTCOME_BY_WINNER = (mc_kernel.A_WINS, mc_kernel.B_WINS, mc_kernel.DRAW)
+
+def _run_monte_engine(a0: Combatant, b0: Combatant, seeds: range,
+                      outcomes: bytearray, rounds: List[int]) -> None:
+    """Full object-engine trials; fills *outcomes* / *rounds* by index
+    (same buffer contract as `mc_kernel.run_trials`)."""
+    # One private copy of each fighter, restored in place between trials
+    # (the caller's templates are never touched), and one encounter that is
+    # re-armed per trial; no turn-by-turn log needed for aggregates.
+    p1, p2 = a0.clone_for_battle(), b0.clone_for_battle()
+    roster = [p1, p2]
+    battle = CombatEncounter([], rng_seed=0, collect_log=False)
+    for n, trial_seed in enumerate(seeds):
+        p1.reset_battle_state()
+        p2.reset_battle_state()
+        battle.reset(roster, trial_seed)
+        battle.run_battle()
+        rounds[n]   = battle.rounds_fought
+        outcomes[n] = _OUTCOME_BY_WINNER[battle.winner_index()]
+
+
 def run_monte(num_trials: int, seed: int | None = None) -> None:
     a0, b0 = make_default_fighters()
-    wins_a = wins_b = draws = 0
-    rounds: List[int] = []
-
-    base_seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
-    for n in range(num_trials):
-        trial_seed = base_seed + n
-        p1, p2 = deepcopy(a0), deepcopy(b0)
-        battle   = CombatEncounter([p1, p2], rng_seed=trial_seed)
-        log      = battle.run_battle()
-        rounds.append(len(log.rounds))
-
-        winner = next((c for c in battle.combatants if c.is_alive), None)
-        if   winner is p1: wins_a += 1
-        elif winner is p2: wins_b += 1
-        else:              draws  += 1
+    base_seed = seed if seed is not None else secrets.randbits(32)
+    seeds = range(base_seed, base_seed + num_trials)
+    # Load-out text is built once, up front – the trials never touch it.
+    snap_a, snap_b = snapshot(a0), snapshot(b0)
+
+    # Preallocated per-trial results, filled by index.  `outcomes` is a
+    # compact byte buffer of outcome codes so the tally below is three
+    # C-level `bytearray.count` calls.
+    outcomes = bytearray(num_trials)
+    rounds: List[int] = [0] * num_trials
+
+    # Fighters are flattened once; if both fit the flat kernel the object
+    # engine is skipped entirely – same seeds, same results, far less
+    # overhead.
+    prof_a, prof_b = mc_kernel.battle_profile(a0), mc_kernel.battle_profile(b0)
+    if prof_a is not None and prof_b is not None:
+        mc_kernel.run_trials(prof_a, prof_b, seeds, outcomes, rounds)
+    else:
+        _run_monte_engine(a0, b0, seeds, outcomes, rounds)
+
+    wins_a, wins_b, draws = (outcomes.count(k) for k in _OUTCOME_BY_WINNER)
 
     # ── summary ────────────────────────────────────────────────────────
     print("=== Monte-Carlo Summary ===")
-    print(snapshot(a0))
-    print(snapshot(b0))
+    print(snap_a)
+    print(snap_b)
     print(f"Trials run          : {num_trials}")
     print(f"{a0.name} wins       : {wins_a}  ({wins_a/num_trials*100:.1f}%)")
     print(f"{b0.name} wins   : {wins_b}  ({wins_b/num_trials*100:.1f}%)")
     print(f"Draws               : {draws}")
-    print(f"Avg. rounds/fight   : {mean(rounds):.2f}")
+    print(f"Avg. rounds/fight   : {sum(rounds) / num_trials:.2f}")
     print(f"Shortest fight      : {min(rounds)} rounds")
     print(f"Longest fight       : {max(rounds)} rounds")
 
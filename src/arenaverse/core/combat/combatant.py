@@ -16,12 +16,19 @@ Why separate things this way?
 ---------------------------------------------------------------------------
 TL;DR of public interface
 ---------------------------------------------------------------------------
-•  `.total_stats()` – aggregated view (base + gear + effects).
-•  `.take_damage(raw, *, dtype='phys')` – apply mitigation, subtract HP,
+•  `.total_stats()` – aggregated view (base + gear + effects), memoised;
+   call `.mark_dirty()` after mutating `base_stats` by hand.
+•  `.stat_vector()` – the same totals as a list indexed by
+   `formulas.StatIdx`, for index‑based hot loops.
+•  `.equip(item)` / `.unequip(item)` – change gear, keeping the cached
+   gear bonus in sync.
+•  `.take_damage(raw, dmg_type=DmgType.PHYSICAL)` – apply mitigation, subtract HP,
    return *post‑mitigation* damage actually done (for the log).
 •  `.heal(amount)` – bounded by max HP.
 •  `.apply_effect(StatusEffect)` – resolves stacking rules and stores it.
 •  `.tick_effects()` – call once per turn; triggers DOT, decrements timers.
+•  `.clone_for_battle()` – cheap fresh copy for a new fight (replaces
+   `copy.deepcopy` in the runners).
 •  Properties: `.hp`, `.is_alive`, `.max_hp`, `.name`.
 """
 
@@ -30,8 +37,10 @@ from __future__ import annotations
 # ----------------------------------------------------------------------- #
 # Std‑lib & typing
 # ----------------------------------------------------------------------- #
+from collections import defaultdict
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Dict, List, TYPE_CHECKING, Any, Optional
+from typing import Callable, DefaultDict, Dict, List, TYPE_CHECKING, Any, Optional
 
 # ----------------------------------------------------------------------- #
 # Internal imports – note: only things **below** Combatant in dependency
@@ -66,14 +75,15 @@ STAT_KEYS: tuple[str, ...] = (
 
 # ----------------------------------------------------------------------- #
 # Helper: tiny additive container for gear stats so we don’t write the
-# same comprehension three times.
+# same comprehension three times.  Every Item must expose `stat_bonus`
+# (empty dict if it grants nothing) – no getattr probing.
 # ----------------------------------------------------------------------- #
 def _sum_item_stats(items: List["Item"]) -> Dict[str, int]:
-    total: Dict[str, int] = {}
+    total: DefaultDict[str, int] = defaultdict(int)
     for itm in items:
-        for k, v in getattr(itm, "stat_bonus", {}).items():
-            total[k] = total.get(k, 0) + v
-    return total
+        for k, v in itm.stat_bonus.items():
+            total[k] += v
+    return dict(total)
 
 
 # ----------------------------------------------------------------------- #
@@ -101,8 +111,9 @@ class Combatant:
     hotbar: List["SkillHandle"] = field(default_factory=list) # Add this line
 
     # ─────────────────────────────────────────────────────────────────── #
-    # Equipped items (weapon, armour …).  Each item is expected to expose
-    # a `.stat_bonus` dict and later a `contributing_mods()` for ModBus.
+    # Equipped items (weapon, armour …).  Each item must expose a
+    # `.stat_bonus` dict (possibly empty) and later a `contributing_mods()` for ModBus.
+    # Items are **immutable templates** during combat – clones share them.
     # ─────────────────────────────────────────────────────────────────── #
     equipment: List["Item"] = field(default_factory=list, repr=False)
 
@@ -119,10 +130,43 @@ class Combatant:
     # A local RNG for things like flee chance; seeded by encounter.
     rng: Any = field(default=None, repr=False)
 
+    # ─────────────────────────────────────────────────────────────────── #
+    # Memoised `total_stats()` result.  Rebuilt lazily whenever something
+    # that feeds it changes (effects applied/expired, `mark_dirty()`).
+    # ─────────────────────────────────────────────────────────────────── #
+    _stats_cache: Optional[Dict[str, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _stats_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    # Same numbers as a `formulas.StatIdx`‑indexed list; built on demand.
+    _stats_vec: Optional[List[int]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # Summed `stat_bonus` of everything in `equipment`.  Computed once here
+    # and kept current by `equip()` / `unequip()` instead of re‑walking the
+    # gear list on every stats rebuild.
+    _gear_bonus: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    # First live instance of each effect tag in `active_effects`, so the
+    # stacking check in `apply_effect()` is a dict hit, not a list scan.
+    # Extra STACK_ADD copies are not indexed – only the tag matters.
+    _effects_by_tag: Dict[str, "StatusEffect"] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    # Death hook, fired once by `take_damage()` when HP drops to 0.  The
+    # running encounter installs it to keep its alive bookkeeping current
+    # whoever dealt the blow (skill, DOT, recoil …).
+    _on_death: Optional[Callable[[], None]] = field(
+        default=None, init=False, repr=False, compare=False)
+
     # ------------------------------------------------------------------ #
-    # Dataclass post‑init hook – sets HP to max if caller left it at -1.
+    # Dataclass post‑init hook – caches gear totals and sets HP to max if
+    # caller left it at -1.
     # ------------------------------------------------------------------ #
     def __post_init__(self):
+        self._gear_bonus = _sum_item_stats(self.equipment)
+        for eff in self.active_effects:
+            self._effects_by_tag.setdefault(eff.tag, eff)
         if self.hp == -1:
             self.hp = self.max_hp
 
@@ -145,47 +189,83 @@ class Combatant:
     # ------------------------------------------------------------------ #
     def total_stats(self) -> Dict[str, int]:
         '''
-        Return a fresh **dict** combining base + gear + effect mods.
+        Return the **dict** combining base + gear + effect mods.
+
+        The result is cached until the next `mark_dirty()`, so treat it as
+        read‑only – copy it before mutating.
+        '''
+        if self._stats_dirty:
+            self._stats_cache = self._recompute_stats()
+            self._stats_vec = None
+            self._stats_dirty = False
+        return self._stats_cache
+
+    def stat_vector(self) -> List[int]:
+        '''`total_stats()` as a list indexed by `formulas.StatIdx` (cached,
+        read‑only).'''
+        stats = self.total_stats()
+        if self._stats_vec is None:
+            self._stats_vec = formulas.stat_vector(stats)
+        return self._stats_vec
+
+    def mark_dirty(self) -> None:
+        """Invalidate the cached stats (e.g. after editing `base_stats`)."""
+        self._stats_dirty = True
+
+    def _recompute_stats(self) -> Dict[str, int]:
+        '''
+        Build a fresh stats dict:
 
         1. Start with *base_stats*.
         2. Add any `stat_bonus` from equipped items.
         3. Add each effect's **flat_mods**.
         4. Apply each effect's **mult_mods** (multiplicative).
+
+        Steps 3 and 4 share one pass over the effects: flats land in
+        *totals* straight away, mults are folded into a per‑key factor
+        and applied at the end, so flats still come first.
         '''
         totals: Dict[str, float] = dict(self.base_stats)
 
-        # 1+2: equipment
-        gear_bonus = _sum_item_stats(self.equipment)
-        for k, v in gear_bonus.items():
+        # 1+2: equipment (pre‑summed, see `_gear_bonus`)
+        for k, v in self._gear_bonus.items():
             totals[k] = totals.get(k, 0) + v
 
-        # 3: flat additive buffs/debuffs
+        # 3+4: effects – flat buffs now, multipliers collected
+        factors: Dict[str, float] = {}
         for eff in self.active_effects:
-            for k, v in getattr(eff, "flat_mods", {}).items():
+            for k, v in eff.flat_mods.items():
                 totals[k] = totals.get(k, 0) + v
+            for k, m in eff.mult_mods.items():
+                factors[k] = factors.get(k, 1.0) * (1 + m)
 
-        # 4: multiplicative (order‑independent because we multiply factors)
-        for eff in self.active_effects:
-            for k, m in getattr(eff, "mult_mods", {}).items():
-                totals[k] = totals.get(k, 0) * (1 + m)
-
-        # Cast everything back to int for downstream math
-        return {k: int(v) for k, v in totals.items()}
+        # Base, gear and flat mods are all ints, so only multiplied entries
+        # need casting back – done as each factor is applied.
+        for k, f in factors.items():
+            totals[k] = int(totals.get(k, 0) * f)
+        return totals
 
     # ------------------------------------------------------------------ #
-    def take_damage(self, raw: int, dmg_type: str = "physical") -> int:
+    def take_damage(self, raw: int,
+                    dmg_type: formulas.DmgType = formulas.DmgType.PHYSICAL,
+                    *, def_vec: Optional[List[int]] = None) -> int:
             """Apply armour / resist mitigation, subtract HP and
             return the **actual** damage taken.
 
             The attacker has already produced a raw‐damage number.
-            We now let `formulas.mitigation()` translate our own stats
+            We now let `formulas.mitigation_v()` translate our own stats
             into a flat reduction, then make sure at least 1 HP lands.
+            Callers that already hold our `stat_vector()` can pass it as
+            *def_vec* to skip the lookup.
             """
-            # `total_stats()` gives our aggregated dictionary of stats
-            reduction = formulas.mitigation(self.total_stats(), dmg_type)
+            vec = def_vec if def_vec is not None else self.stat_vector()
+            reduction = formulas.mitigation_v(vec, dmg_type)
             dealt     = max(1, int(raw - reduction))
 
+            was_alive = self.hp > 0
             self.hp = max(0, self.hp - dealt)
+            if was_alive and self.hp == 0 and self._on_death is not None:
+                self._on_death()
             return dealt
 
     # ------------------------------------------------------------------ #
@@ -197,6 +277,28 @@ class Combatant:
         self.hp = min(self.max_hp, self.hp + amount)
         return self.hp - before
 
+    # ------------------------------------------------------------------ #
+    # Gear
+    # ------------------------------------------------------------------ #
+    def equip(self, item: "Item") -> None:
+        """Add *item* to `equipment` and fold its bonus into the gear cache."""
+        self.equipment.append(item)
+        gear = self._gear_bonus
+        for k, v in item.stat_bonus.items():
+            gear[k] = gear.get(k, 0) + v
+        self._stats_dirty = True
+
+    def unequip(self, item: "Item") -> None:
+        """Remove *item* from `equipment` and rebuild the gear cache.
+
+        Re‑summed rather than subtracted: a key must stay present (even at
+        0) exactly while some equipped item still grants it, so the cache
+        always equals `_sum_item_stats(equipment)`.
+        """
+        self.equipment.remove(item)
+        self._gear_bonus = _sum_item_stats(self.equipment)
+        self._stats_dirty = True
+
     # ------------------------------------------------------------------ #
     # Status‑effect plumbing
     # ------------------------------------------------------------------ #
@@ -209,10 +311,12 @@ class Combatant:
         from ..combat.effects import StackRule  # local import
 
         # Quick path: no effect with same tag yet → just add
-        same = next((e for e in self.active_effects if e.tag == effect.tag), None)
+        same = self._effects_by_tag.get(effect.tag)
         if same is None:
             self.active_effects.append(effect)
+            self._effects_by_tag[effect.tag] = effect
             effect.on_apply(self)
+            self._stats_dirty = True
             return
 
         # Respect chosen stacking policy
@@ -225,17 +329,92 @@ class Combatant:
         elif effect.stack_rule == StackRule.STACK_MERGE:
             same.stacks = min(same.stacks + 1, getattr(same, "max_stacks", 1))
             same.duration = effect.duration
-        # STACK_RULE.REJECT does nothing
+        else:
+            return  # STACK_RULE.REJECT does nothing
+        self._stats_dirty = True
 
     # ------------------------------------------------------------------ #
     def tick_effects(self):
-        """Call at *start of this combatant’s turn*."""
-        for eff in list(self.active_effects):  # copy → we might remove
-            eff.on_tick(self)
+        """Call at *start of this combatant’s turn*.
+
+        Single pass with a write index: survivors are compacted to the
+        front and expired effects are cut off in one slice at the end.
+        Hooks may apply new effects (they land after the ticked ones and
+        are kept) but must not remove effects mid‑tick.
+        """
+        effs = self.active_effects
+        n = len(effs)
+        if not n:
+            return
+        by_tag = self._effects_by_tag
+        reindex = False
+        w = 0
+        for i in range(n):
+            eff = effs[i]
+            if eff.HAS_TICK:            # skip the no‑op base hooks
+                eff.on_tick(self)
             eff.duration -= 1
-            if eff.duration <= 0:
+            if eff.duration > 0:
+                effs[w] = eff
+                w += 1
+                continue
+            if eff.HAS_REMOVE:
                 eff.on_remove(self)
-                self.active_effects.remove(eff)
+            if by_tag.get(eff.tag) is eff:
+                del by_tag[eff.tag]
+                reindex = True
+        if w == n:
+            return
+
+        del effs[w:n]
+        self._stats_dirty = True
+        # A STACK_ADD twin may still be alive under a tag we just dropped.
+        if reindex:
+            for eff in effs:
+                by_tag.setdefault(eff.tag, eff)
+
+    # ------------------------------------------------------------------ #
+    # Battle setup
+    # ------------------------------------------------------------------ #
+    def clone_for_battle(self) -> "Combatant":
+        """Return a fresh, full‑HP copy ready to enter a new encounter.
+
+        Much cheaper than `copy.deepcopy`: base stats get a shallow dict
+        copy, items are shared (they never mutate in combat), each hotbar
+        skill is shallow‑copied with its cooldown cleared (cooldowns are
+        per‑owner state) and no status effects carry over.  A `None`
+        hotbar stays `None` – the encounter fills it in lazily.
+        """
+        hotbar = None
+        if self.hotbar is not None:
+            hotbar = [copy(s) for s in self.hotbar]
+            for s in hotbar:
+                s.current_cd = 0
+        return Combatant(
+            name=self.name,
+            base_stats=self.base_stats.copy(),
+            hotbar=hotbar,
+            equipment=list(self.equipment),
+            active_effects=[],
+            rng=None,
+        )
+
+    def reset_battle_state(self) -> None:
+        """Return *this* unit to its pre‑fight state, in place.
+
+        The in‑place counterpart of `clone_for_battle` for callers that
+        rerun the same fighters many times (Monte‑Carlo): effects are
+        dropped without their `on_remove` hooks, every hotbar cooldown is
+        cleared and HP is refilled.  Base stats and gear are untouched, so
+        the stats cache only needs rebuilding if effects were active.
+        """
+        if self.active_effects:
+            self.active_effects.clear()
+            self._effects_by_tag.clear()
+            self._stats_dirty = True
+        for s in self.hotbar or ():   # None: the encounter builds it lazily
+            s.current_cd = 0
+        self.hp = self.max_hp
 
     # ------------------------------------------------------------------ #
     # Debug helper – pretty string
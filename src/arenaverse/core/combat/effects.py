@@ -21,7 +21,12 @@ from __future__ import annotations
 # --------------------------------------------------------------------- #
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, TYPE_CHECKING, Any
+from typing import ClassVar, Dict, TYPE_CHECKING, Any
+
+# --------------------------------------------------------------------- #
+# Internal imports – formulas sits *below* us, so this is safe.
+# --------------------------------------------------------------------- #
+from ..combat.formulas import DmgType
 
 if TYPE_CHECKING:
     from ..combat.combatant import Combatant
@@ -61,6 +66,18 @@ class StatusEffect:
     flat_mods: Dict[str, int] = field(default_factory=dict)
     mult_mods: Dict[str, float] = field(default_factory=dict)
 
+    # Does this class override `on_tick` / `on_remove`?  Set automatically
+    # per subclass so Combatant.tick_effects can skip the no‑op defaults.
+    HAS_TICK: ClassVar[bool] = False
+    HAS_REMOVE: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        # Two‑arg super(): slots=True rebuilds the class, which leaves the
+        # implicit __class__ cell of zero‑arg super() pointing at the old one.
+        super(StatusEffect, cls).__init_subclass__(**kwargs)
+        cls.HAS_TICK = cls.on_tick is not StatusEffect.on_tick
+        cls.HAS_REMOVE = cls.on_remove is not StatusEffect.on_remove
+
     # ---------------------------------------------------------------- #
     # Lifecycle hooks – default to no‑op so subclasses implement only
     # what they need.
@@ -105,7 +122,7 @@ class PoisonDOT(StatusEffect):
 
     def on_tick(self, target: 'Combatant'):
         # True damage – ignores armour
-        target.take_damage(self.magnitude, dmg_type="true")
+        target.take_damage(self.magnitude, dmg_type=DmgType.TRUE)
 
 # --------------------------------------------------------------------- #
 class Shield(StatusEffect):
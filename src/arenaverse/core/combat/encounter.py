@@ -17,54 +17,99 @@ from __future__ import annotations
 # -------------------------------------------------------------------- #
 import random
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import partial
+from typing import Callable, List, Dict, Any
 
 # -------------------------------------------------------------------- #
 # Internal imports
 # -------------------------------------------------------------------- #
 from ..combat.combatant import Combatant
-from ..combat.skills import select_first_ready, SkillHandle, ActionResult
+from ..combat.skills import (
+    select_first_ready, SkillHandle, ActionResult, BasicAttack, PowerStrike,
+)
+from ..util.random import make_rng
 # Encounter deliberately does NOT import effects or formulas directly.
 
 
+# Hard cap on rounds per battle, to avoid infinite loops.
+MAX_ROUNDS = 99
+
+
 # -------------------------------------------------------------------- #
 # Helper: simple initiative roll
 # In future we'll move to a full speed queue, but for now we roll once at
 # battle start and keep that fixed order.
 # -------------------------------------------------------------------- #
-def _roll_initiative(combatants: List[Combatant], rnd) -> List[Combatant]:
-    """Return a new list sorted descending by DEX, tie‑broken randomly."""
-    # snapshot so we don't mutate caller order
-    order = list(combatants)
-    # Sort by (DEX, random float) descending
-    order.sort(key=lambda c: (c.total_stats().get("DEX", 0), rnd.random()), reverse=True)
-    return order
+def _roll_initiative(combatants: List[Combatant], rnd) -> List[int]:
+    """Return roster indices sorted descending by DEX, tie‑broken randomly."""
+    # Decorate once (one DEX read + one roll per unit, in roster order),
+    # sort the plain tuples, undecorate.  -i keeps the old stable-sort
+    # order on an exact (DEX, roll) tie.
+    rand = rnd.random
+    keyed = [(c.total_stats().get("DEX", 0), rand(), -i)
+             for i, c in enumerate(combatants)]
+    keyed.sort(reverse=True)
+    return [-neg_i for _, _, neg_i in keyed]
 
 
 # -------------------------------------------------------------------- #
-# Battle log – small wrapper around list[ActionResult]
+# Battle log – one flat list of ActionResults plus round offsets, so the
+# battle loop appends into a single buffer instead of a list per round.
 # -------------------------------------------------------------------- #
+_ROUND_HDR = "===== Round %d ====="
+_MISS_LINE = "%s's %s MISSED %s"
+_HIT_LINE  = "%s used %s on %s for %d dmg%s"
+_CRIT_TAG  = " CRIT!"
+
 @dataclass(slots=True)
 class BattleLog:
-    rounds: List[List[ActionResult]] = field(default_factory=list)
+    events: List[ActionResult] = field(default_factory=list)
+    # index into `events` where each round begins
+    round_starts: List[int] = field(default_factory=list)
+
+    def start_round(self):
+        self.round_starts.append(len(self.events))
+
+    def record(self, action: ActionResult):
+        self.events.append(action)
 
     def add_round(self, actions: List[ActionResult]):
-        self.rounds.append(actions)
+        """Append a whole round at once (start_round + record each)."""
+        self.round_starts.append(len(self.events))
+        self.events.extend(actions)
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.round_starts)
+
+    @property
+    def rounds(self) -> List[List[ActionResult]]:
+        """Per‑round view, sliced out of `events` on demand."""
+        ev, starts = self.events, self.round_starts
+        ends = starts[1:] + [len(ev)]
+        return [ev[a:b] for a, b in zip(starts, ends)]
 
     def as_dict(self) -> Dict[str, Any]:
         return {"rounds": [[a.as_dict() for a in r] for r in self.rounds]}
 
     def __str__(self):
+        # One line per action through fixed %-templates, walking the flat
+        # event buffer by offset instead of materialising per-round slices.
         out = []
-        for i, rnd in enumerate(self.rounds, 1):
-            out.append(f"===== Round {i} =====")
-            for action in rnd:
+        add = out.append
+        ev, starts = self.events, self.round_starts
+        ends = starts[1:] + [len(ev)]
+        for round_no, (lo, hi) in enumerate(zip(starts, ends), 1):
+            add(_ROUND_HDR % round_no)   # even if the round was empty
+            for j in range(lo, hi):
+                action = ev[j]
                 if not action.hit:
-                    out.append(f"{action.actor}'s {action.skill_used} MISSED {action.target}")
+                    add(_MISS_LINE % (action.actor, action.skill_used,
+                                      action.target))
                 else:
-                    crit = " CRIT!" if action.crit else ""
-                    out.append(f"{action.actor} used {action.skill_used} on {action.target} "
-                               f"for {action.damage} dmg{crit}")
+                    add(_HIT_LINE % (action.actor, action.skill_used,
+                                     action.target, action.damage,
+                                     _CRIT_TAG if action.crit else ""))
         return "\n".join(out)
 
 
@@ -77,30 +122,79 @@ class CombatEncounter:
 
     combatants: List[Combatant]
     rng_seed: int = 42  # deterministic by default
+    # False → run_battle() records nothing in its BattleLog (aggregate
+    # runs only need `rounds_fought` and who is left standing).
+    collect_log: bool = True
 
     # these fields are initialised in __post_init__
     rng: random.Random = field(init=False, repr=False)
+    # Uniform [0, 1) source for skill rolls – `rng.random`, bound once.
+    # Skills draw through this so a batched source can be swapped in here.
+    next_rand: Callable[[], float] = field(init=False, repr=False)
     initiative: List[Combatant] = field(init=False, repr=False)
+    # Roster index of each `initiative` entry, and a bitmask with bit i set
+    # while `combatants[i]` is alive (cleared by each unit's death hook) –
+    # counting, targeting and the winner check become int ops instead of
+    # scans over the roster.
+    _initiative_slots: List[int] = field(init=False, repr=False)
+    _alive_mask: int = field(init=False, default=0, repr=False)
+    # Length of the last run_battle(), logged or not.
+    rounds_fought: int = field(init=False, default=0, repr=False)
 
     def __post_init__(self):
-        self.rng = random.Random(self.rng_seed)
+        self.rng = make_rng(self.rng_seed)
+        self.next_rand = self.rng.random   # stays valid across reset()
+        self._bind_combatants()
+
+    def reset(self, combatants: List[Combatant], rng_seed: int) -> None:
+        """Re‑arm this encounter for a new fight instead of building a new
+        one – reseeds the existing RNG and rerolls initiative."""
+        self.combatants = combatants
+        self.rng_seed = rng_seed
+        self.rng.seed(rng_seed)
+        self._bind_combatants()
+
+    def _bind_combatants(self):
         # Give each combatant the same RNG (substream) for consistency
         for c in self.combatants:
             c.rng = self.rng
-        self.initiative = _roll_initiative(self.combatants, self.rng)
+        slots = _roll_initiative(self.combatants, self.rng)
+        self._initiative_slots = slots
+        self.initiative = [self.combatants[i] for i in slots]
+        self._alive_mask = self._scan_alive()
 
     # ---------------------------------------------------------------- #
     def run_battle(self) -> BattleLog:
         """Loop rounds until only one faction (for now: last man standing)."""
         log = BattleLog()
+        self._alive_mask = self._scan_alive()  # HP may have changed since setup
+        self.rounds_fought = 0
+        if self._count_alive() <= 1:
+            return log  # nothing to fight over
 
-        round_idx = 0
-        while self._count_alive() > 1 and round_idx < 99:  # hard cap to avoid inf loops
-            round_idx += 1
-            actions_this_round: List[ActionResult] = []
+        # Death hooks (clear the unit's bit in the alive mask) live only for
+        # this call: fighters outlive encounters and may enter others, so
+        # they must not keep reporting to – or referencing – this one.
+        roster = self.combatants
+        for i, c in enumerate(roster):
+            c._on_death = partial(self._mark_dead, i)
+        try:
+            self.rounds_fought = self._play_rounds(log)
+        finally:
+            for c in roster:
+                c._on_death = None
+        return log
 
-            for actor in self.initiative:
-                if not actor.is_alive:
+    def _play_rounds(self, log: BattleLog) -> int:
+        """The round loop proper; returns the number of rounds fought."""
+        collect = self.collect_log
+        roster = self.combatants
+        for round_idx in range(1, MAX_ROUNDS + 1):
+            if collect:
+                log.start_round()
+
+            for slot, actor in zip(self._initiative_slots, self.initiative):
+                if not self._alive_mask >> slot & 1:
                     continue  # dead before their turn
                 # 1. Start‑of‑turn effects tick
                 actor.tick_effects()
@@ -108,37 +202,50 @@ class CombatEncounter:
                     continue  # DOT might have killed them
 
                 # 2. Pick a target – simplest: first alive enemy
-                target = self._pick_target(actor)
-                if target is None:
+                t_slot = self._pick_target(slot)
+                if t_slot < 0:
                     continue  # no enemies left
+                target = roster[t_slot]
 
                 # 3. Choose a skill (AI placeholder)
-                skill = select_first_ready(self._get_hotbar(actor))
+                hotbar = self._get_hotbar(actor)   # reused by the CD tick
+                skill = select_first_ready(hotbar)
 
                 # 4. Execute
                 result = skill.execute(actor, target, self, self.rng)
-                actions_this_round.append(result)
+                if collect:
+                    log.record(result)
+                # (deaths already cleared their bits via `_mark_dead`)
 
                 # 5. Tick cooldowns for ALL skills in actor's bar
-                for s in self._get_hotbar(actor):
-                    s.tick_cd()
+                # (plain attribute ops – no method call per slot)
+                for s in hotbar:
+                    if s.current_cd > 0:
+                        s.current_cd -= 1
 
                 # Early exit if battle ended mid‑round
                 if self._count_alive() <= 1:
                     break
 
-            log.add_round(actions_this_round)
+            if self._count_alive() <= 1:
+                break  # last one standing – no next round
 
-        return log
+        return round_idx
+
+    # ---------------------------------------------------------------- #
+    def winner_index(self) -> int:
+        """Roster index of the first combatant still standing, or -1 if
+        nobody is (draw)."""
+        mask = self._alive_mask
+        return (mask & -mask).bit_length() - 1   # lowest set bit
 
     # ---------------------------------------------------------------- #
     # Helper – naive: everyone fights everyone (no team logic yet)
     # ---------------------------------------------------------------- #
-    def _pick_target(self, actor: Combatant) -> Optional[Combatant]:
-        for c in self.combatants:
-            if c is not actor and c.is_alive:
-                return c
-        return None
+    def _pick_target(self, actor_slot: int) -> int:
+        """Roster index of the first living enemy of *actor_slot*, or -1."""
+        others = self._alive_mask & ~(1 << actor_slot)
+        return (others & -others).bit_length() - 1   # lowest set bit
 
     # ---------------------------------------------------------------- #
     def _get_hotbar(self, actor: Combatant) -> List[SkillHandle]:
@@ -146,10 +253,21 @@ class CombatEncounter:
         hb = getattr(actor, "hotbar", None)
         if hb is None:
             # Lazy create: BasicAttack only
-            from ..combat.skills import BasicAttack, PowerStrike
             actor.hotbar = [PowerStrike(), BasicAttack()]
         return actor.hotbar
 
     # ---------------------------------------------------------------- #
     def _count_alive(self) -> int:
-        return sum(1 for c in self.combatants if c.is_alive)
\ No newline at end of file
+        return self._alive_mask.bit_count()
+
+    def _mark_dead(self, slot: int) -> None:
+        """Death hook (`Combatant._on_death`): drop *slot* from the mask."""
+        self._alive_mask &= ~(1 << slot)
+
+    def _scan_alive(self) -> int:
+        """Rebuild the alive bitmask from the combatants' HP."""
+        mask = 0
+        for i, c in enumerate(self.combatants):
+            if c.is_alive:
+                mask |= 1 << i
+        return mask
\ No newline at end of file
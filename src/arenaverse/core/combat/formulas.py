@@ -1,20 +1,92 @@
 """
 Pure maths – no game objects.
+
+The dict-taking public helpers are thin shims: they pull the stats they
+need out of the dicts and hand plain numbers to the private scalar
+kernels (`_*_k`).  The kernels only touch floats/ints, so hot loops (and
+the batch simulator) can call them directly.
 """
 
 from __future__ import annotations
 import math
 import random
+from enum import IntEnum
+from typing import Callable, List, Tuple
 
 __all__ = [
+    # damage types
+    "DmgType",
+    # stat vectors
+    "StatIdx", "STAT_VECTOR_KEYS", "stat_vector",
     # secondary
     "sec_hp", "sec_weapon_damage",
     # opposed helpers
     "sigmoid_opposed", "chance_to_hit", "chance_to_crit",
     # damage
-    "raw_damage", "mitigation", "final_damage",
+    "raw_damage", "mitigation", "mitigation_v", "final_damage",
+    # fused
+    "resolve_physical", "resolve_physical_v",
 ]
 
+# ──────────────────────────────────────────────────────────────
+# Damage types
+# ──────────────────────────────────────────────────────────────
+class DmgType(IntEnum):
+    """How a hit is mitigated and which stat scales it."""
+    PHYSICAL = 0    # armor, STR
+    MAGICAL = 1     # resist, INT
+    TRUE = 2        # unmitigated, INT
+
+# Plain-int copies for the kernels' comparisons (cheaper than enum access).
+_PHYS, _MAGIC, _TRUE = int(DmgType.PHYSICAL), int(DmgType.MAGICAL), int(DmgType.TRUE)
+
+# Legacy string spellings, still accepted by the public helpers.
+_DMG_BY_NAME = {
+    "physical": DmgType.PHYSICAL,
+    "magical": DmgType.MAGICAL,
+    "true": DmgType.TRUE,
+}
+
+def _coerce(dmg_type: DmgType | str) -> int:
+    """Map a legacy name onto DmgType; unknown names count as true damage
+    (no mitigation, INT scaling) exactly like the old string checks."""
+    if type(dmg_type) is str:
+        return _DMG_BY_NAME.get(dmg_type, DmgType.TRUE)
+    return dmg_type
+
+# ──────────────────────────────────────────────────────────────
+# 0.  Fixed-slot stat vectors
+# ──────────────────────────────────────────────────────────────
+class StatIdx(IntEnum):
+    """Slot of each formula-relevant stat inside a stat vector."""
+    STR = 0
+    DEX = 1
+    AGI = 2
+    INT = 3
+    CON = 4
+    ACC = 5
+    EVA = 6
+    CRT = 7
+    WPN = 8     # "weapon_damage"
+    ARM = 9     # "armor"
+    RES = 10    # "resist"
+
+# Plain-int slots for the vector kernels (cheaper than enum access).
+_STR, _DEX, _AGI = int(StatIdx.STR), int(StatIdx.DEX), int(StatIdx.AGI)
+_WPN, _ARM, _RES = int(StatIdx.WPN), int(StatIdx.ARM), int(StatIdx.RES)
+
+# Dict key for each StatIdx slot, in slot order.
+STAT_VECTOR_KEYS: tuple[str, ...] = (
+    "STR", "DEX", "AGI", "INT", "CON", "ACC", "EVA", "CRT",
+    "weapon_damage", "armor", "resist",
+)
+
+def stat_vector(stats: dict) -> List[int]:
+    """Flatten a stats dict into a list indexed by `StatIdx` (missing → 0)."""
+    get = stats.get
+    return [get(k, 0) for k in STAT_VECTOR_KEYS]
+
+
 # ──────────────────────────────────────────────────────────────
 # 1.  Secondary attributes
 # ──────────────────────────────────────────────────────────────
@@ -22,19 +94,25 @@ def sec_hp(CON: int) -> int:
     return CON * 10
 
 def sec_weapon_damage(wpn_dmg: int, STR: int = 0, INT: int = 0,
-                      dmg_type: str = "physical") -> float:
-    stat = STR if dmg_type == "physical" else INT
+                      dmg_type: DmgType | str = DmgType.PHYSICAL) -> float:
+    stat = STR if _coerce(dmg_type) == _PHYS else INT
     return wpn_dmg + 0.5 * stat
 
 
 # ──────────────────────────────────────────────────────────────
 # 2.  Generic opposed-stat logistic curve
 # ──────────────────────────────────────────────────────────────
+_SIG_BASE, _SIG_CEILING, _SIG_K = 5.0, 95.0, 0.15
+
+def _sigmoid_opposed_k(att: float, deff: float,
+                       base: float, ceiling: float, k: float) -> float:
+    pct = base + (ceiling - base) / (1 + math.exp(-k * (att - deff)))
+    return pct / 100.0
+
 def sigmoid_opposed(att: float, deff: float,
-                    *, base=5.0, ceiling=95.0, k=0.15) -> float:
+                    *, base=_SIG_BASE, ceiling=_SIG_CEILING, k=_SIG_K) -> float:
     """Bounded logistic curve used for all opposed rolls."""
-    pct = base + (ceiling - base) / (1 + math.exp(-k * (att - deff)))
-    return pct / 100.0          # convert 5-95 % → 0.05-0.95
+    return _sigmoid_opposed_k(att, deff, base, ceiling, k)  # 0.05-0.95
 
 
 # Convenience RNG so tests can seed deterministically
@@ -46,33 +124,119 @@ def set_seed(seed: int | None) -> None: _rng.seed(seed)
 # 3.  Chances
 # ──────────────────────────────────────────────────────────────
 def chance_to_hit(att_stats: dict, def_stats: dict) -> float:
-    return sigmoid_opposed(
-        att_stats.get("DEX", 0) + att_stats.get("AGI", 0),
+    get = att_stats.get
+    return _sigmoid_opposed_k(
+        get("DEX", 0) + get("AGI", 0),
         def_stats.get("AGI", 0),
+        _SIG_BASE, _SIG_CEILING, _SIG_K,
     )
 
 def chance_to_crit(att_stats: dict, def_stats: dict) -> float:
-    return sigmoid_opposed(
+    return _sigmoid_opposed_k(
         att_stats.get("DEX", 0),
         def_stats.get("AGI", 0),
+        _SIG_BASE, _SIG_CEILING, _SIG_K,
     )
 
 
 # ──────────────────────────────────────────────────────────────
 # 4.  Damage pipeline
 # ──────────────────────────────────────────────────────────────
-def raw_damage(att_stats: dict, dmg_type: str = "physical") -> float:
-    base = att_stats.get("weapon_damage", 0)
-    STR, INT = att_stats.get("STR", 0), att_stats.get("INT", 0)
-    return base + 0.5 * (STR if dmg_type == "physical" else INT)
-
-def mitigation(def_stats: dict, dmg_type: str = "physical") -> float:
-    if dmg_type == "physical":
-        return def_stats.get("armor", 0) * 0.25
-    if dmg_type == "magical":
-        return def_stats.get("resist", 0) * 0.30
+def _raw_damage_k(weapon_damage: float, STR: float, INT: float,
+                  dmg_code: int) -> float:
+    return weapon_damage + 0.5 * (STR if dmg_code == _PHYS else INT)
+
+def _mitigation_k(armor: float, resist: float, dmg_code: int) -> float:
+    if dmg_code == _PHYS:
+        return armor * 0.25
+    if dmg_code == _MAGIC:
+        return resist * 0.30
     return 0  # true dmg
 
-def final_damage(att_stats: dict, def_stats: dict, dmg_type="physical") -> int:
-    dmg = raw_damage(att_stats, dmg_type) - mitigation(def_stats, dmg_type)
-    return max(1, int(dmg))
\ No newline at end of file
+def _final_damage_k(weapon_damage: float, STR: float, INT: float,
+                    armor: float, resist: float, dmg_code: int) -> int:
+    dmg = (_raw_damage_k(weapon_damage, STR, INT, dmg_code)
+           - _mitigation_k(armor, resist, dmg_code))
+    return max(1, int(dmg))
+
+
+def raw_damage(att_stats: dict,
+               dmg_type: DmgType | str = DmgType.PHYSICAL) -> float:
+    get = att_stats.get
+    return _raw_damage_k(
+        get("weapon_damage", 0), get("STR", 0), get("INT", 0),
+        _coerce(dmg_type),
+    )
+
+def mitigation(def_stats: dict,
+               dmg_type: DmgType | str = DmgType.PHYSICAL) -> float:
+    code = _coerce(dmg_type)
+    if code == _TRUE:
+        return 0  # nothing to look up
+    get = def_stats.get
+    return _mitigation_k(get("armor", 0), get("resist", 0), code)
+
+def mitigation_v(def_vec: List[int],
+                 dmg_type: DmgType | str = DmgType.PHYSICAL) -> float:
+    """`mitigation` for a `StatIdx`-indexed stat vector."""
+    code = _coerce(dmg_type)
+    if code == _TRUE:
+        return 0
+    return _mitigation_k(def_vec[_ARM], def_vec[_RES], code)
+
+def final_damage(att_stats: dict, def_stats: dict,
+                 dmg_type: DmgType | str = DmgType.PHYSICAL) -> int:
+    a_get, d_get = att_stats.get, def_stats.get
+    return _final_damage_k(
+        a_get("weapon_damage", 0), a_get("STR", 0), a_get("INT", 0),
+        d_get("armor", 0), d_get("resist", 0),
+        _coerce(dmg_type),
+    )
+
+
+# ──────────────────────────────────────────────────────────────
+# 5.  Fused resolvers
+# ──────────────────────────────────────────────────────────────
+def _resolve_physical_k(DEX: float, AGI: float, AGI_def: float,
+                        weapon_damage: float, STR: float,
+                        rand: Callable[[], float], dmg_mult: float,
+                        sure_hit: bool) -> Tuple[bool, bool, int]:
+    # *rand* is the only non-number in here: rolls are drawn lazily – the
+    # hit roll unless *sure_hit*, the crit roll only on a hit – so the RNG
+    # stream matches the separate chance_to_* calls this replaced.
+    if not sure_hit and rand() > _sigmoid_opposed_k(
+            DEX + AGI, AGI_def, _SIG_BASE, _SIG_CEILING, _SIG_K):
+        return False, False, 0
+
+    dmg = _raw_damage_k(weapon_damage, STR, 0, _PHYS) * dmg_mult
+    crit = rand() < _sigmoid_opposed_k(DEX, AGI_def,
+                                       _SIG_BASE, _SIG_CEILING, _SIG_K)
+    if crit:
+        dmg *= 1.5
+    return True, crit, int(dmg)
+
+def resolve_physical(att_stats: dict, def_stats: dict,
+                     rand: Callable[[], float], dmg_mult: float = 1.0,
+                     *, sure_hit: bool = False) -> Tuple[bool, bool, int]:
+    """
+    Hit roll, crit roll and raw physical damage in one pass over the dicts.
+
+    Returns ``(hit, crit, raw)``; *raw* is pre-mitigation (the defender's
+    `take_damage` applies armor).
+    """
+    a_get = att_stats.get
+    return _resolve_physical_k(
+        a_get("DEX", 0), a_get("AGI", 0), def_stats.get("AGI", 0),
+        a_get("weapon_damage", 0), a_get("STR", 0),
+        rand, dmg_mult, sure_hit,
+    )
+
+def resolve_physical_v(att_vec: List[int], def_vec: List[int],
+                       rand: Callable[[], float], dmg_mult: float = 1.0,
+                       *, sure_hit: bool = False) -> Tuple[bool, bool, int]:
+    """`resolve_physical` for `StatIdx`-indexed stat vectors."""
+    return _resolve_physical_k(
+        att_vec[_DEX], att_vec[_AGI], def_vec[_AGI],
+        att_vec[_WPN], att_vec[_STR],
+        rand, dmg_mult, sure_hit,
+    )
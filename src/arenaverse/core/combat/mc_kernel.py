@@ -0,0 +1,138 @@
+"""arenaverse.core.combat.mc_kernel
+====================================
+Flat duel simulator for head‑less Monte‑Carlo runs.
+
+`CombatEncounter` is built for readability: Combatant objects, stat dicts,
+ActionResult records.  When all we want is *who won and how fast* over
+thousands of trials, that machinery is overhead.  This module reduces each
+fighter to a fixed tuple of numbers (`battle_profile`) and replays the
+encounter rules on plain locals.
+
+Profiles are `Combatant.stat_vector()` (slots from `formulas.StatIdx`)
+with max HP appended.
+
+Contract
+--------
+*  Only fighters the flat model can represent are accepted: no status
+   effects and a hotbar of nothing but `BasicAttack` (what the encounter
+   falls back to anyway).  `battle_profile()` returns *None* otherwise and
+   callers must use the full engine.
+*  Given the same seed, `run_trials()` consumes the RNG in exactly
+   the order `CombatEncounter.run_battle()` does, so results match the
+   object engine trial for trial.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+# The private scalar kernels are the single source of truth for the maths.
+from ..combat.formulas import (
+    StatIdx, STAT_VECTOR_KEYS,
+    _PHYS, _SIG_BASE, _SIG_CEILING, _SIG_K,
+    _mitigation_k, _raw_damage_k, _sigmoid_opposed_k,
+)
+from ..combat.combatant import Combatant
+from ..combat.skills import BasicAttack
+from ..combat.encounter import MAX_ROUNDS   # same hard cap as run_battle
+from ..util.random import make_rng
+
+# -------------------------------------------------------------------- #
+# Profile layout – plain‑int copies of the StatIdx slots (enum attribute
+# access is too slow for the inner loop) plus the appended HP slot.
+# -------------------------------------------------------------------- #
+P_DEX, P_AGI = int(StatIdx.DEX), int(StatIdx.AGI)
+P_STR, P_INT = int(StatIdx.STR), int(StatIdx.INT)
+P_WPN, P_ARM, P_RES = int(StatIdx.WPN), int(StatIdx.ARM), int(StatIdx.RES)
+P_HP = len(STAT_VECTOR_KEYS)
+
+Profile = Tuple[int, ...]
+
+# Outcome codes written by run_trials()
+A_WINS, B_WINS, DRAW = 0, 1, 2
+
+
+# -------------------------------------------------------------------- #
+# Flattening
+# -------------------------------------------------------------------- #
+def battle_profile(unit: Combatant) -> Optional[Profile]:
+    """Snapshot *unit* as it would enter a fresh battle, or *None* if the
+    flat model can't represent it (effects or non‑basic skills).  A `None`
+    hotbar counts as non‑basic: the encounter would fill it with
+    PowerStrike + BasicAttack."""
+    if unit.active_effects or unit.hotbar is None:
+        return None
+    if any(type(s) is not BasicAttack for s in unit.hotbar):
+        return None
+    return (*unit.stat_vector(), unit.max_hp)
+
+
+# -------------------------------------------------------------------- #
+# Kernel
+# -------------------------------------------------------------------- #
+def swing_table(att: Profile, deff: Profile) -> Tuple[float, float, int, int]:
+    """Everything about *att* hitting *deff* that doesn't depend on a roll:
+    ``(hit_chance, crit_chance, damage, crit_damage)``, damage already
+    mitigated.  Fixed for the whole matchup, so it is built once per
+    direction rather than on every swing of every trial."""
+    hit = _sigmoid_opposed_k(att[P_DEX] + att[P_AGI], deff[P_AGI],
+                             _SIG_BASE, _SIG_CEILING, _SIG_K)
+    crit = _sigmoid_opposed_k(att[P_DEX], deff[P_AGI],
+                              _SIG_BASE, _SIG_CEILING, _SIG_K)
+    raw = _raw_damage_k(att[P_WPN], att[P_STR], att[P_INT], _PHYS)
+    mit = _mitigation_k(deff[P_ARM], deff[P_RES], _PHYS)
+    return (hit, crit,
+            max(1, int(int(raw) - mit)),
+            max(1, int(int(raw * 1.5) - mit)))
+
+
+def run_trials(a: Profile, b: Profile, seeds: Sequence[int],
+               out_winner: bytearray, out_rounds: List[int]) -> None:
+    """Play one duel per seed, writing results into caller‑owned buffers.
+
+    ``out_winner[i]`` gets the outcome code (`A_WINS` / `B_WINS` / `DRAW`)
+    and ``out_rounds[i]`` the fight length for ``seeds[i]``; both must be
+    at least ``len(seeds)`` long.  One RNG is reseeded per trial instead
+    of allocating a fresh one.
+    """
+    rng = make_rng()
+    reseed, rand = rng.seed, rng.random
+    hp_a0, hp_b0 = a[P_HP], b[P_HP]
+    dex_a, dex_b = a[P_DEX], b[P_DEX]
+    # Per-matchup invariants – the trial loop below only rolls and subtracts.
+    hit_ab, crit_ab, dmg_ab, cdmg_ab = swing_table(a, b)
+    hit_ba, crit_ba, dmg_ba, cdmg_ba = swing_table(b, a)
+
+    for i in range(len(seeds)):
+        reseed(seeds[i])
+
+        # Initiative: (DEX, random) descending, stable → *a* wins exact ties.
+        key_a = (dex_a, rand())
+        key_b = (dex_b, rand())
+        a_first = key_a >= key_b
+
+        # Name the sides by turn order: 1 acts first, 2 second.
+        if a_first:
+            hp1, hp2 = hp_a0, hp_b0
+            hit1, crit1, dmg1, cdmg1 = hit_ab, crit_ab, dmg_ab, cdmg_ab
+            hit2, crit2, dmg2, cdmg2 = hit_ba, crit_ba, dmg_ba, cdmg_ba
+        else:
+            hp1, hp2 = hp_b0, hp_a0
+            hit1, crit1, dmg1, cdmg1 = hit_ba, crit_ba, dmg_ba, cdmg_ba
+            hit2, crit2, dmg2, cdmg2 = hit_ab, crit_ab, dmg_ab, cdmg_ab
+
+        rounds = 0
+        while hp1 > 0 and hp2 > 0 and rounds < MAX_ROUNDS:
+            rounds += 1
+            # hit unless the roll exceeds the chance; crit rolled on a hit
+            if rand() <= hit1:
+                hp2 -= cdmg1 if rand() < crit1 else dmg1
+                if hp2 <= 0:
+                    break
+            if rand() <= hit2:
+                hp1 -= cdmg2 if rand() < crit2 else dmg2
+
+        hp_a, hp_b = (hp1, hp2) if a_first else (hp2, hp1)
+        # Winner is the first survivor in roster order, like the runners.
+        out_winner[i] = A_WINS if hp_a > 0 else B_WINS if hp_b > 0 else DRAW
+        out_rounds[i] = rounds
@@ -22,9 +22,21 @@ from typing import Any, Dict, TYPE_CHECKING, List
 # Internal imports (only low‑level helpers; avoid circular deps)
 # ──────────────────────────────────────────────────────────────────────
 from ..combat import formulas
+from ..combat.formulas import DmgType
 from ..util.random import rng_bool
 from ..combat.combatant import Combatant
 
+# Resolved once at import; PowerStrike used to retry this on every hit.
+try:
+    from ..combat.effects import Rage as _RAGE_CLS
+except ImportError:     # Rage not implemented yet – early scaffolding
+    _RAGE_CLS = None
+
+# Hot‑path aliases for execute(): one global lookup instead of
+# module‑attribute / enum‑member lookups on every swing.
+_resolve_physical_v = formulas.resolve_physical_v
+_PHYSICAL = DmgType.PHYSICAL
+
 if TYPE_CHECKING:
     from ..combat.encounter import CombatEncounter
     from ..combat.effects import StatusEffect
@@ -48,8 +60,18 @@ class ActionResult:
     # placeholder for future: applied_effects: list[str] = field(default_factory=list)
 
     def as_dict(self) -> Dict[str, Any]:
-        """Return a plain dict for easy JSON dumps."""
-        return self.__dict__
+        """Return a plain dict for easy JSON dumps.
+
+        Built field by field – a slotted dataclass has no `__dict__`.
+        """
+        return {
+            "actor": self.actor,
+            "target": self.target,
+            "skill_used": self.skill_used,
+            "hit": self.hit,
+            "crit": self.crit,
+            "damage": self.damage,
+        }
 
 # -------------------------------------------------------------------- #
 # Base class – every concrete skill inherits from this
@@ -58,8 +80,8 @@ class ActionResult:
 class SkillHandle:
     """
     An object that lives in a combatant's hotbar.  It holds its own cooldown
-    timer so the CombatEncounter can simply call `tick_cd()` on everyone at
-    the end of a round.
+    timer; the CombatEncounter decrements `current_cd` (never below 0)
+    directly at the end of its owner's turn.
     """
     name: str
     cooldown_max: int = 0
@@ -69,10 +91,6 @@ class SkillHandle:
     def is_ready(self) -> bool:
         return self.current_cd == 0
 
-    def tick_cd(self):
-        if self.current_cd > 0:
-            self.current_cd -= 1
-
     def reset_cd(self):
         """Set the timer back to full (called after a successful execute)."""
         self.current_cd = self.cooldown_max
@@ -87,7 +105,9 @@ class SkillHandle:
     ) -> ActionResult:
         """
         Sub‑classes override this.  They MUST call `self.reset_cd()` at the
-        end so that future turns see the correct cooldown.
+        end so that future turns see the correct cooldown.  Rolls should
+        come from `encounter.next_rand()`; *rnd* is the same underlying
+        RNG, passed for helpers such as `util.random.rng_bool`.
         """
         raise NotImplementedError
 
@@ -110,29 +130,20 @@ class BasicAttack(SkillHandle):
         encounter: "CombatEncounter",
         rnd,
     ) -> ActionResult:
-        res = ActionResult(actor=actor.name, target=target.name, skill_used=self.name)
-
-        # 1. Did we hit?
-        hit_chance = formulas.chance_to_hit(
-            actor.total_stats(), target.total_stats())
-        if rnd.random() > hit_chance:
-            res.hit = False
+        res = ActionResult(actor.name, target.name, self.name)
+        # Snapshot both stat vectors once; nothing below changes them.
+        a_vec = actor.stat_vector()
+        t_vec = target.stat_vector()
+
+        # 1‑3. Hit, crit and raw damage in one fused call
+        res.hit, res.crit, dmg = _resolve_physical_v(
+            a_vec, t_vec, encounter.next_rand)
+        if not res.hit:
             self.reset_cd()  # basic attack still "spends" the action
             return res
 
-        res.hit = True
-
-        # 2. Base damage starts at STR
-        dmg = actor.total_stats().get("STR", 1)
-        # 2 + 3.  Damage pipeline now centralised in formulas.py
-        dmg = formulas.raw_damage(actor.total_stats(), "physical")
-        if rnd.random() < formulas.chance_to_crit(
-            actor.total_stats(), target.total_stats()):
-            res.crit = True
-            dmg *= 1.5    # apply multiplier only on an actual crit
-        
         # 4. Mitigation & HP loss
-        res.damage = target.take_damage(int(dmg), "physical")
+        res.damage = target.take_damage(dmg, _PHYSICAL, def_vec=t_vec)
         
         self.reset_cd()
         return res
@@ -152,23 +163,18 @@ class PowerStrike(SkillHandle):
         encounter: "CombatEncounter",
         rnd,
     ) -> ActionResult:
-        res = ActionResult(actor=actor.name, target=target.name, skill_used=self.name)
-        res.hit = True  # guaranteed hit for demo purposes
+        res = ActionResult(actor.name, target.name, self.name)
+        # Snapshot both stat vectors once – Rage is only applied afterwards.
+        a_vec = actor.stat_vector()
+        t_vec = target.stat_vector()
 
-        dmg = formulas.raw_damage(actor.total_stats(), "physical") * 2
-        if rnd.random() < formulas.chance_to_crit(
-            actor.total_stats(), target.total_stats()):
-            res.crit = True
-            dmg *= 1.5
-        res.damage = target.take_damage(int(dmg), "physical")
+        # guaranteed hit for demo purposes
+        res.hit, res.crit, dmg = _resolve_physical_v(
+            a_vec, t_vec, encounter.next_rand, 2, sure_hit=True)
+        res.damage = target.take_damage(dmg, _PHYSICAL, def_vec=t_vec)
 
-        
-        # Attempt to apply Rage if the effect class exists
-        try:
-            from ..combat.effects import Rage
-            actor.apply_effect(Rage(source=actor))
-        except (ImportError, AttributeError):
-            pass  # Rage not implemented yet – safe in early scaffolding
+        if _RAGE_CLS is not None:
+            actor.apply_effect(_RAGE_CLS(source=actor))
 
         self.reset_cd()
         return res
@@ -176,12 +182,16 @@ class PowerStrike(SkillHandle):
 # -------------------------------------------------------------------- #
 # Helper – pick the first ready skill from a hotbar
 # -------------------------------------------------------------------- #
+# BasicAttack has no cooldown, so one shared instance can serve every unit.
+# (PowerStrike & co. carry per-owner cooldowns and must stay per hotbar.)
+_FALLBACK_ATTACK = BasicAttack()
+
 def select_first_ready(hotbar: List[SkillHandle]) -> SkillHandle:
     """
     Utility for simple AI: iterate the list in order, return the first skill
-    whose cooldown is 0.  If none are ready, return a new BasicAttack().
+    whose cooldown is 0.  If none are ready, return the shared BasicAttack.
     """
     for s in hotbar:
         if s.is_ready():
             return s
-    return BasicAttack()
\ No newline at end of file
+    return _FALLBACK_ATTACK
\ No newline at end of file
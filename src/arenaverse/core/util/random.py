@@ -8,7 +8,8 @@ Why bother?
    reproduce battles bit‑for‑bit.
 *  **Easy future swap** – If we need a faster RNG or PCG32, we update one file.
 
-Only two helpers are exposed for now: `rng_bool` and `rng_float`.
+Gameplay code gets its generators from `make_rng` and draws through
+`rng_bool` / `rng_float` (or the generator's own `random()`).
 '''
 
 from __future__ import annotations
@@ -18,6 +19,16 @@ from typing import Any
 # ---------------------------------------------------------------------------#
 # Public helpers
 # ---------------------------------------------------------------------------#
+def make_rng(seed: Any = None) -> "random.Random":
+    '''New generator for one battle / simulation run.
+
+    Every engine‑side RNG is built here, so swapping the algorithm is a
+    one‑line change.  Callers rely only on the `random.Random` surface
+    used today – `random()`, `uniform()` and `seed()` for in‑place reuse.
+    '''
+    return random.Random(seed)
+
+
 def rng_bool(rnd: "random.Random", p: float) -> bool:
     '''Return *True* with probability **p** (0 ≤ p ≤ 1).'''
     if p <= 0.0:
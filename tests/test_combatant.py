@@ -0,0 +1,156 @@
+"""
+Combatant bookkeeping that is cached rather than recomputed: the gear
+bonus totals, the memoised `total_stats()` / `stat_vector()`, and the
+in-place effect list with its tag index.
+
+Run from the repo root:  PYTHONPATH=src python -m unittest discover tests
+"""
+import unittest
+
+from arenaverse.core.combat.combatant import Combatant, _sum_item_stats
+from arenaverse.core.combat.effects import (
+    PoisonDOT, Rage, Shield, StackRule, StatusEffect,
+)
+from arenaverse.core.combat.formulas import StatIdx
+
+
+class _Item:
+    """Minimal stand-in: the engine only reads `stat_bonus`."""
+    def __init__(self, **stat_bonus):
+        self.stat_bonus = stat_bonus
+
+
+class GearCache(unittest.TestCase):
+
+    def assertCacheFresh(self, unit: Combatant):
+        self.assertEqual(unit._gear_bonus, _sum_item_stats(unit.equipment))
+
+    def test_equip_unequip_sequence_matches_resum(self):
+        zero, sword, ring = _Item(STR=0), _Item(STR=3, DEX=1), _Item(DEX=-1)
+        unit = Combatant("u", {"STR": 5}, equipment=[zero])
+        self.assertCacheFresh(unit)
+
+        for step in (lambda: unit.equip(sword),
+                     lambda: unit.equip(ring),        # DEX nets to 0
+                     lambda: unit.equip(_Item(STR=0)),
+                     lambda: unit.unequip(sword),
+                     lambda: unit.unequip(ring),
+                     lambda: unit.equip(sword)):
+            step()
+            self.assertCacheFresh(unit)
+
+    def test_zero_bonus_key_survives_unequipping_a_twin(self):
+        first, second = _Item(STR=0), _Item(STR=0)
+        unit = Combatant("u", {}, equipment=[first])
+        unit.equip(second)
+        unit.unequip(second)
+        self.assertIn("STR", unit.total_stats())  # `first` still grants it
+
+    def test_gear_changes_invalidate_stats_and_vector(self):
+        sword = _Item(STR=3)
+        unit = Combatant("u", {"STR": 5})
+        self.assertEqual(unit.total_stats()["STR"], 5)
+        self.assertEqual(unit.stat_vector()[StatIdx.STR], 5)
+
+        unit.equip(sword)
+        self.assertEqual(unit.total_stats()["STR"], 8)
+        self.assertEqual(unit.stat_vector()[StatIdx.STR], 8)
+
+        unit.unequip(sword)
+        self.assertEqual(unit.total_stats()["STR"], 5)
+        self.assertEqual(unit.stat_vector()[StatIdx.STR], 5)
+
+    def test_mark_dirty_picks_up_base_stat_edits(self):
+        unit = Combatant("u", {"STR": 5})
+        unit.stat_vector()
+        unit.base_stats["STR"] = 9
+        unit.mark_dirty()
+        self.assertEqual(unit.total_stats()["STR"], 9)
+        self.assertEqual(unit.stat_vector()[StatIdx.STR], 9)
+
+
+class _LoggedShield(Shield):
+    """Shield that records its `on_remove` calls."""
+    def __init__(self, source, duration, log):
+        super().__init__(source, duration)
+        self.log = log
+
+    def on_remove(self, target):
+        self.log.append((self.tag, target.name))
+
+
+class _Bleed(StatusEffect):
+    """Independent STACK_ADD copies under one tag."""
+    def __init__(self, source, duration):
+        super().__init__(tag="dot.bleed", duration=duration, source=source,
+                         stack_rule=StackRule.STACK_ADD)
+
+
+class TickEffects(unittest.TestCase):
+
+    def setUp(self):
+        self.caster = Combatant("caster", {"INT": 20})   # poison 3, shield +8
+        self.unit = Combatant("unit", {"CON": 10, "ARM": 1})
+
+    def test_mixed_expiry_order(self):
+        removed = []
+        unit = self.unit
+        shield = _LoggedShield(self.caster, 1, removed)
+        poison = PoisonDOT(self.caster, duration=3)
+        rage = Rage(self.caster, duration=2)
+        for eff in (shield, poison, rage):
+            unit.apply_effect(eff)
+        self.assertEqual(unit.total_stats()["ARM"], 9)
+        hp0 = unit.hp
+
+        unit.tick_effects()          # shield expires ahead of the others
+        self.assertEqual(removed, [("buff.shield", "unit")])
+        self.assertEqual(unit.active_effects, [poison, rage])
+        self.assertNotIn("buff.shield", unit._effects_by_tag)
+        self.assertEqual(unit.total_stats()["ARM"], 1)   # cache invalidated
+        self.assertEqual(unit.hp, hp0 - 3)
+
+        unit.tick_effects()          # rage expires, poison still ticking
+        self.assertEqual(unit.active_effects, [poison])
+        self.assertEqual(unit._effects_by_tag, {"dot.poison": poison})
+        self.assertEqual(unit.hp, hp0 - 6)
+
+        unit.tick_effects()          # poison's last tick, then gone
+        self.assertEqual(unit.active_effects, [])
+        self.assertEqual(unit._effects_by_tag, {})
+        self.assertEqual(unit.hp, hp0 - 9)
+        self.assertEqual(removed, [("buff.shield", "unit")])  # fired once
+
+    def test_stack_add_twin_is_reindexed(self):
+        unit = self.unit
+        first, second = _Bleed(self.caster, 1), _Bleed(self.caster, 3)
+        unit.apply_effect(first)
+        unit.apply_effect(second)
+        self.assertIs(unit._effects_by_tag["dot.bleed"], first)
+
+        unit.tick_effects()          # indexed copy expires, twin survives
+        self.assertEqual(unit.active_effects, [second])
+        self.assertIs(unit._effects_by_tag["dot.bleed"], second)
+
+        third = _Bleed(self.caster, 2)
+        unit.apply_effect(third)     # still stacks beside the survivor
+        self.assertEqual(unit.active_effects, [second, third])
+
+    def test_refresh_after_expiry_applies_fresh(self):
+        unit = self.unit
+        unit.apply_effect(PoisonDOT(self.caster, duration=1))
+        unit.apply_effect(PoisonDOT(self.caster, duration=1))   # refresh
+        self.assertEqual(len(unit.active_effects), 1)
+
+        unit.tick_effects()
+        self.assertEqual(unit._effects_by_tag, {})
+
+        again = PoisonDOT(self.caster, duration=2)
+        unit.apply_effect(again)     # first-add path: on_apply runs
+        self.assertEqual(unit.active_effects, [again])
+        self.assertIs(unit._effects_by_tag["dot.poison"], again)
+        self.assertEqual(again.magnitude, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
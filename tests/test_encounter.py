@@ -0,0 +1,118 @@
+"""
+CombatEncounter – alive tracking, hooks – and its BattleLog.
+
+Run from the repo root:  PYTHONPATH=src python -m unittest discover tests
+"""
+import json
+import unittest
+
+from arenaverse.core.combat.combatant import Combatant
+from arenaverse.core.combat.effects import PoisonDOT
+from arenaverse.core.combat.encounter import (
+    BattleLog, CombatEncounter, MAX_ROUNDS,
+)
+from arenaverse.core.combat.skills import (
+    ActionResult, BasicAttack, PowerStrike, SkillHandle,
+)
+from arenaverse.core.battlerunner.battlerunner import make_default_fighters
+
+
+class BattleLogAsDict(unittest.TestCase):
+
+    def test_hand_built_log_round_trips(self):
+        hit = ActionResult("a", "b", "Basic Attack", True, False, 7)
+        miss = ActionResult("b", "a", "Basic Attack")
+        log = BattleLog()
+        log.add_round([hit, miss])
+        log.add_round([])                     # empty rounds are kept
+        log.start_round()
+        log.record(hit)
+
+        expected = {"rounds": [[hit.as_dict(), miss.as_dict()],
+                               [],
+                               [hit.as_dict()]]}
+        self.assertEqual(log.as_dict(), expected)
+        self.assertEqual(json.loads(json.dumps(log.as_dict())), expected)
+
+    def test_battle_log_matches_its_rounds(self):
+        a, b = make_default_fighters()
+        battle = CombatEncounter([a, b], rng_seed=7)
+        log = battle.run_battle()
+        dumped = json.loads(json.dumps(log.as_dict()))
+        self.assertEqual(len(dumped["rounds"]), battle.rounds_fought)
+        self.assertEqual(dumped["rounds"],
+                         [[act.as_dict() for act in rnd] for rnd in log.rounds])
+
+
+class _Boom(SkillHandle):
+    """Raises mid-battle, after checking the death hooks are live."""
+    def __init__(self):
+        super().__init__(name="Boom")
+
+    def execute(self, actor, target, encounter, rnd):
+        assert actor._on_death is not None and target._on_death is not None
+        raise RuntimeError("boom")
+
+
+class AliveTracking(unittest.TestCase):
+    """The alive bitmask is driven by `Combatant._on_death` hooks that
+    `run_battle` installs for the duration of the call only."""
+
+    def assertHooksCleared(self, *units):
+        for u in units:
+            self.assertIsNone(u._on_death, u.name)
+
+    def test_dot_kill_during_tick_clears_mask(self):
+        caster = Combatant("caster", {"INT": 20, "CON": 10})
+        victim = Combatant("victim", {"DEX": 99, "CON": 10})  # acts first
+        victim.apply_effect(PoisonDOT(caster, duration=3))
+        victim.hp = 1
+        battle = CombatEncounter([victim, caster], rng_seed=1)
+        log = battle.run_battle()
+
+        self.assertEqual(victim.hp, 0)
+        self.assertEqual(battle._alive_mask, 0b10)
+        self.assertEqual(battle.winner_index(), 1)
+        self.assertEqual(battle.rounds_fought, 1)
+        self.assertEqual(log.rounds, [[]])   # victim never swung, no target
+        self.assertHooksCleared(victim, caster)
+
+    def test_power_strike_battle_bookkeeping(self):
+        for seed in range(20):
+            a, b = make_default_fighters()
+            a.hotbar = [PowerStrike(), BasicAttack()]   # applies Rage
+            b.hotbar = [PowerStrike()]
+            battle = CombatEncounter([a, b], rng_seed=seed)
+            log = battle.run_battle()
+            with self.subTest(seed=seed):
+                alive = [c.is_alive for c in (a, b)]
+                self.assertEqual(battle._alive_mask,
+                                 alive[0] | alive[1] << 1)
+                self.assertEqual(battle.winner_index(),
+                                 alive.index(True) if any(alive) else -1)
+                self.assertEqual(battle.rounds_fought, log.num_rounds)
+                self.assertLess(battle.rounds_fought, MAX_ROUNDS)
+                self.assertHooksCleared(a, b)
+
+    def test_hooks_cleared_when_run_battle_raises(self):
+        a, b = make_default_fighters()
+        a.hotbar = [_Boom()]
+        b.hotbar = [_Boom()]
+        battle = CombatEncounter([a, b], rng_seed=3)
+        with self.assertRaises(RuntimeError):
+            battle.run_battle()
+        self.assertHooksCleared(a, b)
+
+    def test_later_encounter_does_not_steal_hooks(self):
+        a, b = make_default_fighters()
+        first = CombatEncounter([a, b], rng_seed=42)
+        CombatEncounter([a, b], rng_seed=42)   # built, never run
+        first.run_battle()
+        self.assertLess(first.rounds_fought, MAX_ROUNDS)
+        self.assertEqual(first.winner_index(),
+                         0 if a.is_alive else 1 if b.is_alive else -1)
+        self.assertHooksCleared(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+The flat Monte-Carlo kernel is a second copy of the duel rules, so it must
+stay in step with the object engine: same initiative, round loop, roll
+order and rounding.  These tests play both over random stat lines and
+seeds and require identical outcomes and fight lengths.
+
+Run from the repo root:  PYTHONPATH=src python -m unittest discover tests
+"""
+import random
+import unittest
+
+from arenaverse.core.battlerunner import battlerunner
+from arenaverse.core.combat import formulas, mc_kernel
+from arenaverse.core.combat.combatant import Combatant
+
+STAT_NAMES = ("STR", "CON", "DEX", "AGI", "INT",
+              "weapon_damage", "armor", "resist")
+TRIALS = 50
+
+
+def _random_fighter(rnd: random.Random, name: str) -> Combatant:
+    return Combatant(name, {k: rnd.randint(0, 15) for k in STAT_NAMES})
+
+
+def _run_both(a: Combatant, b: Combatant, seeds: range):
+    n = len(seeds)
+    eng_out, eng_rounds = bytearray(n), [0] * n
+    battlerunner._run_monte_engine(a, b, seeds, eng_out, eng_rounds)
+    ker_out, ker_rounds = bytearray(n), [0] * n
+    mc_kernel.run_trials(mc_kernel.battle_profile(a),
+                         mc_kernel.battle_profile(b),
+                         seeds, ker_out, ker_rounds)
+    return (eng_out, eng_rounds), (ker_out, ker_rounds)
+
+
+class KernelMatchesEngine(unittest.TestCase):
+
+    def test_random_stat_lines(self):
+        rnd = random.Random(0)
+        for case in range(60):
+            a = _random_fighter(rnd, "a")
+            b = _random_fighter(rnd, "b")
+            if rnd.random() < 0.3:      # DEX tie → initiative tie-break
+                b.base_stats["DEX"] = a.base_stats["DEX"]
+                b.mark_dirty()
+            if rnd.random() < 0.2:      # 0 max HP → instant outcome
+                a.base_stats["CON"] = 0
+                a.mark_dirty()
+            seeds = range(case * 100, case * 100 + TRIALS)
+            with self.subTest(case=case, a=a.base_stats, b=b.base_stats):
+                engine, kernel = _run_both(a, b, seeds)
+                self.assertEqual(engine, kernel)
+
+    def test_round_cap(self):
+        # Minimum damage vs huge HP: every fight runs into MAX_ROUNDS.
+        a = Combatant("a", {"CON": 500})
+        b = Combatant("b", {"CON": 500})
+        engine, kernel = _run_both(a, b, range(TRIALS))
+        self.assertEqual(engine, kernel)
+        self.assertEqual(set(kernel[1]), {mc_kernel.MAX_ROUNDS})
+
+    def test_swing_table_matches_formulas(self):
+        # The per-matchup table must equal what a BasicAttack swing
+        # computes through formulas + take_damage.
+        rnd = random.Random(1)
+        for case in range(100):
+            a = _random_fighter(rnd, "a")
+            b = _random_fighter(rnd, "b")
+            a_st, b_st = a.total_stats(), b.total_stats()
+            raw = formulas.raw_damage(a_st)
+            mit = formulas.mitigation(b_st)
+            expected = (
+                formulas.chance_to_hit(a_st, b_st),
+                formulas.chance_to_crit(a_st, b_st),
+                max(1, int(int(raw) - mit)),
+                max(1, int(int(raw * 1.5) - mit)),
+            )
+            got = mc_kernel.swing_table(mc_kernel.battle_profile(a),
+                                        mc_kernel.battle_profile(b))
+            with self.subTest(case=case):
+                self.assertEqual(got, expected)
+
+    def test_unrepresentable_units_have_no_profile(self):
+        self.assertIsNone(
+            mc_kernel.battle_profile(Combatant("lazy", {}, hotbar=None)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""
+Skill-side DTOs.
+
+Run from the repo root:  PYTHONPATH=src python -m unittest discover tests
+"""
+import json
+import unittest
+
+from arenaverse.core.combat.skills import ActionResult
+
+
+class ActionResultAsDict(unittest.TestCase):
+
+    def test_exact_dict(self):
+        res = ActionResult("Knight", "Orc", "Power Strike",
+                           hit=True, crit=True, damage=17)
+        self.assertEqual(res.as_dict(), {
+            "actor": "Knight",
+            "target": "Orc",
+            "skill_used": "Power Strike",
+            "hit": True,
+            "crit": True,
+            "damage": 17,
+        })
+
+    def test_defaults_and_independence(self):
+        res = ActionResult("a", "b", "Basic Attack")
+        d = res.as_dict()
+        self.assertEqual(d, {"actor": "a", "target": "b",
+                             "skill_used": "Basic Attack",
+                             "hit": False, "crit": False, "damage": 0})
+        d["damage"] = 99                     # a copy, not a live view
+        self.assertEqual(res.damage, 0)
+        self.assertEqual(json.loads(json.dumps(d))["damage"], 99)
+
+
+if __name__ == "__main__":
+    unittest.main()